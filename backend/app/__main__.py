@@ -1,13 +1,36 @@
 from __future__ import annotations
+import copy
 import os
+import sys
 import uvicorn
+from dotenv import load_dotenv
+from uvicorn.config import LOG_LEVELS, LOGGING_CONFIG
 
 def main() -> None:
+    # `.env` must be loaded here as well as in `app.main`: the settings below are read before
+    # uvicorn imports the application.
+    load_dotenv()
+    is_production = os.getenv("ENV", "development").lower() == "production"
+    log_level = (os.getenv("LOG_LEVEL") or ("warning" if is_production else "info")).lower()
+    if log_level not in LOG_LEVELS:
+        raise SystemExit(f"Invalid LOG_LEVEL '{log_level}'; expected one of: {', '.join(LOG_LEVELS)}")
+    # Route application loggers through uvicorn's handler via `log_config` rather than
+    # `logging.basicConfig`, so the level also applies inside the autoreload worker process.
+    log_config = copy.deepcopy(LOGGING_CONFIG)
+    log_config["root"] = {"handlers": ["default"], "level": log_level.upper()}
     uvicorn.run(
         "app.main:app",
         host=os.getenv("HOST", "0.0.0.0"),
         port=int(os.getenv("PORT", "8000")),
-        reload=os.getenv("UVICORN_RELOAD", "true").lower() == "true",
+        reload=not is_production and os.getenv("UVICORN_RELOAD", "true").lower() == "true",
+        # Request the fast implementations explicitly so a missing `uvicorn[standard]`
+        # extra fails at startup instead of silently falling back to asyncio + h11.
+        # uvloop does not support Windows, so the stdlib loop is used there.
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        ws="websockets",
+        log_level=log_level,
+        log_config=log_config,
     )
 
 if __name__ == "__main__":
@@ -1,24 +1,55 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-import os
-import json
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, Any
 
 import httpx
+import msgspec
+import orjson
+import simdjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, ConfigDict, Field
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import Field
+from pydantic_settings import BaseSettings
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-LM_STUDIO_BASE_URL = os.getenv("http://127.0.0.1:1234", "http://127.0.0.1:1234")
+
+class Settings(BaseSettings):
+    """Backend configuration, read from the environment once at import time."""
+
+    lm_studio_base_url: str = "http://127.0.0.1:1234"
+    vite_dev_server: str = "http://localhost:5173"
+    additional_origins: str = ""
+    # LM Studio serves one GPU; the default of 1 queues chats here and keeps its prompt cache warm.
+    lm_max_concurrency: int = Field(default=1, ge=1)
+
+
+settings = Settings()
+
+LM_STUDIO_BASE_URL = settings.lm_studio_base_url
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
 
 class LMStudioAPIError(RuntimeError):
@@ -32,10 +63,26 @@ class LMStudioAPIError(RuntimeError):
 class LMStudioClient:
     """Thin client wrapper around the LM Studio API."""
 
-    def __init__(self, base_url: str) -> None:
+    _CHAT_CACHE_SIZE = 128
+    _MODELS_TIMEOUT = httpx.Timeout(10.0)
+    _CHAT_TIMEOUT = httpx.Timeout(60.0)
+
+    def __init__(self, base_url: str, max_concurrency: int = 1) -> None:
         self._base_url = base_url.rstrip("/")
         self._selected_model: str | None = None
         self._cached_models: list[dict[str, Any]] = []
+        self._cached_model_ids: set[str] = set()
+        self._parser = simdjson.Parser()
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=self._CHAT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            # HTTP/2 is negotiated via ALPN, so it only takes effect for https:// LM Studio URLs;
+            # plain http:// (the local default) stays on pooled HTTP/1.1 connections.
+            http2=True,
+        )
+        self._chat_semaphore = asyncio.Semaphore(max_concurrency)
+        self._chat_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
 
     @property
     def selected_model(self) -> str | None:
@@ -45,12 +92,15 @@ class LMStudioClient:
     def cached_models(self) -> list[dict[str, Any]]:
         return self._cached_models
 
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client and its keep-alive connections."""
+        await self._client.aclose()
+
     async def list_models(self, timeout: httpx.Timeout | None = None) -> list[dict[str, Any]]:
-        timeout = timeout or httpx.Timeout(10.0)
+        timeout = timeout or self._MODELS_TIMEOUT
         try:
-            async with httpx.AsyncClient(base_url=self._base_url, timeout=timeout) as client:
-                response = await client.get("/v1/models")
-                response.raise_for_status()
+            response = await self._client.get("/v1/models", timeout=timeout)
+            response.raise_for_status()
         except httpx.HTTPStatusError as exc:  # pragma: no cover - propagate upstream error codes
             raise LMStudioAPIError(
                 f"LM Studio /v1/models responded with {exc.response.status_code}: {exc.response.text}",
@@ -59,7 +109,7 @@ class LMStudioClient:
         except httpx.HTTPError as exc:  # pragma: no cover - simple network guard
             raise LMStudioAPIError(f"LM Studio /v1/models request failed: {exc}") from exc
 
-        payload = response.json()
+        payload = self._decode_json(response)
         if isinstance(payload, dict):
             models_data = payload.get("data")
         elif isinstance(payload, list):
@@ -71,7 +121,8 @@ class LMStudioClient:
             raise RuntimeError("Unexpected models payload from LM Studio")
 
         self._cached_models = models_data
-        if self._selected_model and not any(model.get("id") == self._selected_model for model in models_data):
+        self._cached_model_ids = {model.get("id") for model in models_data if model.get("id")}
+        if self._selected_model and self._selected_model not in self._cached_model_ids:
             self._selected_model = None
         return models_data
 
@@ -79,23 +130,34 @@ class LMStudioClient:
         if not self._cached_models:
             await self.list_models()
 
-        if not any(model.get("id") == model_id for model in self._cached_models):
+        if model_id not in self._cached_model_ids:
             raise ValueError(f"Model '{model_id}' not available in LM Studio")
 
         self._selected_model = model_id
         return model_id
 
     async def create_chat_completion(self, payload: dict[str, Any]) -> dict[str, Any]:
-        effective_payload = payload.copy()
-        model = effective_payload.get("model") or self._selected_model
-        if not model:
-            raise ValueError("No model supplied and no model has been selected")
-        effective_payload["model"] = model
+        """Runs a chat completion against LM Studio.
+
+        Ownership of `payload` passes to the client: it is updated in place (e.g. the selected
+        model is filled in), so callers must not reuse or mutate it after the call.
+        """
+        effective_payload = self._prepare_chat_payload(payload)
+
+        # Only greedy (temperature 0) completions are deterministic enough to replay from cache.
+        cache_key: bytes | None = None
+        if effective_payload.get("temperature", 1.0) == 0:
+            cache_key = self._chat_cache_key(effective_payload)
+        if cache_key is not None:
+            cached = self._chat_cache.get(cache_key)
+            if cached is not None:
+                self._chat_cache.move_to_end(cache_key)
+                return cached
 
         try:
-            async with httpx.AsyncClient(base_url=self._base_url, timeout=httpx.Timeout(60.0)) as client:
-                response = await client.post("/v1/chat/completions", json=effective_payload)
-                response.raise_for_status()
+            async with self._chat_semaphore:
+                response = await self._client.post("/v1/chat/completions", json=effective_payload)
+            response.raise_for_status()
         except httpx.HTTPStatusError as exc:  # pragma: no cover - passthrough of upstream errors
             raise LMStudioAPIError(
                 f"LM Studio /v1/chat/completions responded with {exc.response.status_code}: {exc.response.text}",
@@ -104,87 +166,250 @@ class LMStudioClient:
         except httpx.HTTPError as exc:  # pragma: no cover - network guard
             raise LMStudioAPIError(f"LM Studio chat request failed: {exc}") from exc
 
-        return response.json()
+        completion = self._decode_json(response)
+        if cache_key is not None:
+            self._chat_cache[cache_key] = completion
+            if len(self._chat_cache) > self._CHAT_CACHE_SIZE:
+                self._chat_cache.popitem(last=False)
+        return completion
+
+    @staticmethod
+    def _chat_cache_key(payload: dict[str, Any]) -> bytes | None:
+        try:
+            canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson cannot encode everything the request decoder accepts (e.g. integers wider
+            # than 64 bits); such requests are simply not cached.
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    async def stream_chat_completion(self, payload: dict[str, Any]) -> AsyncIterator[bytes]:
+        """Returns an iterator over the raw server-sent events of a streamed chat completion.
+
+        The payload is validated and the upstream request opened before this returns, so a missing
+        model or an LM Studio error/network failure is raised here rather than after the response
+        headers have been sent. As with `create_chat_completion`, ownership of `payload` passes
+        to the client.
+        """
+        effective_payload = self._prepare_chat_payload(payload)
+        effective_payload["stream"] = True
+        chunks = self._stream_chat_completion(effective_payload)
+        # Run the generator up to its priming yield: that opens the upstream stream and checks its
+        # status. A started generator is also closed by the event loop if it is abandoned, which
+        # releases the semaphore and the connection even if the client never reads the body.
+        await anext(chunks)
+        return chunks
+
+    async def _stream_chat_completion(self, payload: dict[str, Any]) -> AsyncIterator[bytes]:
+        try:
+            # Ask for an uncompressed event stream; aiter_bytes still decodes one if a proxy
+            # compresses it anyway, since the browser is not told about the upstream encoding.
+            async with self._chat_semaphore, self._client.stream(
+                "POST", "/v1/chat/completions", json=payload, headers={"Accept-Encoding": "identity"}
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                yield b""
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except httpx.HTTPStatusError as exc:  # pragma: no cover - passthrough of upstream errors
+            raise LMStudioAPIError(
+                f"LM Studio /v1/chat/completions responded with {exc.response.status_code}: {exc.response.text}",
+                status_code=exc.response.status_code,
+            ) from exc
+        except httpx.HTTPError as exc:  # pragma: no cover - network guard
+            raise LMStudioAPIError(f"LM Studio chat stream failed: {exc}") from exc
+
+    def _prepare_chat_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not payload.get("model"):
+            if not self._selected_model:
+                raise ValueError("No model supplied and no model has been selected")
+            payload["model"] = self._selected_model
+        return payload
+
+    def _decode_json(self, response: httpx.Response) -> Any:
+        """Parses an upstream response body with simdjson, falling back to the stdlib parser."""
+        # The parser reuses its internal buffer, so the document is materialised eagerly
+        # (recursive=True) before another request can parse into the same buffer.
+        try:
+            return self._parser.parse(response.content, recursive=True)
+        except ValueError:
+            return response.json()
 
 
-def get_allowed_origins() -> list[str]:
-    """Returns the list of allowed origins for CORS."""
-    vite_origin = os.getenv("VITE_DEV_SERVER", "http://localhost:5173")
-    extra = os.getenv("ADDITIONAL_ORIGINS", "")
+@lru_cache(maxsize=1)
+def get_allowed_origins() -> tuple[str, ...]:
+    """Returns the allowed origins for CORS."""
+    vite_origin = settings.vite_dev_server
+    extra = settings.additional_origins
     if extra:
-        return [vite_origin, *[origin.strip() for origin in extra.split(",") if origin.strip()]]
-    return [vite_origin]
+        return (vite_origin, *[origin.strip() for origin in extra.split(",") if origin.strip()])
+    return (vite_origin,)
+
+
+class FastCORSMiddleware:
+    """CORS middleware specialised for a single allowed origin.
+
+    The response headers are built once, so each request only appends a fixed header list
+    instead of matching the `Origin` header against an allowlist. Browsers still enforce the
+    origin check on their side. Preflight requests are answered directly.
+    """
+
+    _ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app: ASGIApp, origin: str) -> None:
+        self.app = app
+        self._headers = [
+            (b"access-control-allow-origin", origin.encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+        self._preflight_headers = [
+            *self._headers,
+            (b"access-control-allow-methods", self._ALLOW_METHODS),
+            (b"access-control-max-age", b"600"),
+            (b"content-length", b"2"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                await self._preflight(request_headers, send)
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self._headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, request_headers: dict[bytes, bytes], send: Send) -> None:
+        headers = self._preflight_headers
+        requested_headers = request_headers.get(b"access-control-request-headers")
+        if requested_headers:
+            headers = [*headers, (b"access-control-allow-headers", requested_headers)]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
 
 
 class MCPServer:
     """Tiny MCP server skeleton that speaks JSON-RPC over WebSocket.
 
     It implements a single resource so the frontend can probe the LLM status.
-    Extend the `handle_request` method to wire in real tools or model logic.
+    Register handlers in `_dispatch` to wire in real tools or model logic.
+    JSON-RPC batches (arrays of requests) are dispatched concurrently.
     """
 
+    _INVALID_REQUEST_FRAME = orjson.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Only JSON-RPC 2.0 is supported"},
+        },
+    )
+
     def __init__(self, model_client: LMStudioClient | None = None) -> None:
         self._resource_cache = [{"name": "status", "description": "Static server status resource."}]
         self._model_client = model_client
-
-    async def connection_loop(self, websocket: WebSocket) -> None:
-        await websocket.accept()
-        await websocket.send_json(
+        # Static frames are serialised once here rather than on every connect / request.
+        self._welcome_frame = orjson.dumps(
             {
                 "jsonrpc": "2.0",
                 "method": "session/welcome",
                 "params": {"message": "MCP server ready"},
             },
         )
+        # Joined by plain concatenation so resource text never needs `%`-escaping.
+        self._resources_list_prefix = b'{"jsonrpc":"2.0","id":'
+        self._resources_list_suffix = b',"result":{"resources":' + orjson.dumps(self._resource_cache) + b"}}"
+        self._dispatch: dict[str, Callable[[Any, dict[str, Any]], Awaitable[bytes]]] = {
+            "ping": self._do_ping,
+            "resources/list": self._do_list,
+            "resources/read": self._do_read,
+        }
 
+    async def connection_loop(self, websocket: WebSocket) -> None:
+        await websocket.accept()
+        await self._send_frame(websocket, self._welcome_frame)
+
+        # Each reply is sent in the background while the next frame is awaited; the previous send
+        # is always finished before another one starts so replies keep their order.
+        pending_send: asyncio.Task[None] | None = None
         try:
             while True:
                 raw_message = await websocket.receive_text()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("MCP frame received: %s", raw_message)
                 response = await self._handle_message(raw_message)
+                if pending_send is not None:
+                    await pending_send
+                    pending_send = None
                 if response is not None:
-                    await websocket.send_text(response)
+                    pending_send = asyncio.create_task(self._send_frame(websocket, response))
         except WebSocketDisconnect:
             logger.info("MCP client disconnected")
         except Exception:  # pragma: no cover - defensive; logs unexpected exceptions
             logger.exception("Error while handling MCP connection")
-
-    async def _handle_message(self, raw_message: str) -> str | None:
+        finally:
+            if pending_send is not None:
+                pending_send.cancel()
+                await asyncio.gather(pending_send, return_exceptions=True)
+
+    @staticmethod
+    async def _send_frame(websocket: WebSocket, frame: bytes) -> None:
+        # Frames are built as UTF-8 bytes and only decoded here, once, because JSON-RPC clients
+        # (including the bundled frontend) expect text frames rather than binary ones.
+        await websocket.send_text(frame.decode())
+
+    async def _handle_message(self, raw_message: str) -> bytes | None:
         try:
-            message = json.loads(raw_message)
-        except json.JSONDecodeError:
+            message = orjson.loads(raw_message)
+        except orjson.JSONDecodeError:
             logger.warning("Received non-JSON MCP message: %s", raw_message)
-            return json.dumps(
+            return orjson.dumps(
                 {
                     "jsonrpc": "2.0",
+                    "id": None,
                     "error": {"code": -32700, "message": "Invalid JSON payload"},
                 },
             )
 
-        if message.get("jsonrpc") != "2.0":
-            return json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32600, "message": "Only JSON-RPC 2.0 is supported"},
-                },
-            )
+        if isinstance(message, list):
+            return await self._handle_batch(message)
+        return await self._handle_request(message)
 
-        method = message.get("method")
-        request_id = message.get("id")
-        params = message.get("params", {})
+    async def _handle_batch(self, messages: list[Any]) -> bytes | None:
+        if not messages:
+            return self._INVALID_REQUEST_FRAME
 
-        result: Any
-        if method == "ping":
-            result = {"message": "pong", "timestamp": asyncio.get_running_loop().time()}
-        elif method == "resources/list":
-            result = {"resources": self._resource_cache}
-        elif method == "resources/read":
-            resource_name = params.get("name")
-            result = {"content": self._read_resource(resource_name)}
-        else:
-            return json.dumps(
+        frames = await asyncio.gather(*(self._handle_request(message) for message in messages))
+        replies = [frame for frame in frames if frame is not None]
+        if not replies:
+            return None
+        return b"[" + b",".join(replies) + b"]"
+
+    async def _handle_request(self, message: Any) -> bytes | None:
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+            return self._INVALID_REQUEST_FRAME
+
+        # Requests without an id are notifications: they are still handled but never answered.
+        is_notification = "id" not in message
+        method = message.get("method")
+        handler = self._dispatch.get(method) if isinstance(method, str) else None
+        if handler is None:
+            if is_notification:
+                return None
+            return orjson.dumps(
                 {
                     "jsonrpc": "2.0",
-                    "id": request_id,
+                    "id": message.get("id"),
                     "error": {
                         "code": -32601,
                         "message": f"Unknown method: {method}",
@@ -192,7 +417,33 @@ class MCPServer:
                 },
             )
 
-        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+        params = message.get("params", {})
+        if not isinstance(params, dict):
+            if is_notification:
+                return None
+            return orjson.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": message.get("id"),
+                    "error": {"code": -32602, "message": "Invalid params: expected an object"},
+                },
+            )
+
+        frame = await handler(message.get("id"), params)
+        return None if is_notification else frame
+
+    async def _do_ping(self, request_id: Any, params: dict[str, Any]) -> bytes:
+        return self._result_frame(request_id, {"message": "pong", "timestamp": asyncio.get_running_loop().time()})
+
+    async def _do_list(self, request_id: Any, params: dict[str, Any]) -> bytes:
+        return self._resources_list_prefix + orjson.dumps(request_id) + self._resources_list_suffix
+
+    async def _do_read(self, request_id: Any, params: dict[str, Any]) -> bytes:
+        return self._result_frame(request_id, {"content": self._read_resource(params.get("name"))})
+
+    @staticmethod
+    def _result_frame(request_id: Any, result: Any) -> bytes:
+        return orjson.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
 
     def _read_resource(self, resource_name: str | None) -> dict[str, Any]:
         if resource_name != "status":
@@ -214,40 +465,68 @@ class MCPServer:
         }
 
 
-class SelectModelRequest(BaseModel):
-    model: str = Field(..., min_length=1)
+class SelectModelRequest(msgspec.Struct, kw_only=True):
+    model: Annotated[str, msgspec.Meta(min_length=1)]
 
 
-class ChatCompletionRequest(BaseModel):
+class ChatCompletionRequest(msgspec.Struct, kw_only=True):
     messages: list[dict[str, Any]]
     model: str | None = None
     temperature: float | None = None
-    max_tokens: int | None = Field(default=None, alias="max_tokens")
-    top_p: float | None = Field(default=None, alias="top_p")
-    frequency_penalty: float | None = Field(default=None, alias="frequency_penalty")
-    presence_penalty: float | None = Field(default=None, alias="presence_penalty")
+    max_tokens: int | None = None
+    top_p: float | None = None
+    frequency_penalty: float | None = None
+    presence_penalty: float | None = None
     stop: list[str] | None = None
+    stream: bool = False
+
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+def json_request_body(struct_type: type[msgspec.Struct]) -> dict[str, Any]:
+    """Builds an `openapi_extra` request body for endpoints that decode their JSON with msgspec."""
+    _, components = msgspec.json.schema_components([struct_type])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[struct_type.__name__]}},
+        },
+    }
 
 
-lm_client = LMStudioClient(LM_STUDIO_BASE_URL)
+lm_client = LMStudioClient(LM_STUDIO_BASE_URL, max_concurrency=settings.lm_max_concurrency)
 mcp_server = MCPServer(model_client=lm_client)
 
-app = FastAPI(title="Local LLM Backend")
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=get_allowed_origins(),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Close the pooled LM Studio client and its keep-alive connections on shutdown.
+    await lm_client.aclose()
+
+
+app = FastAPI(title="Local LLM Backend", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+allowed_origins = get_allowed_origins()
+if len(allowed_origins) == 1:
+    app.add_middleware(FastCORSMiddleware, origin=allowed_origins[0])
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
+    # Mirrors FastAPI's default handler, but renders error bodies with orjson like every other response.
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
 
 
 @app.get("/health")
-async def health() -> JSONResponse:
-    return JSONResponse({"status": "ok"})
+async def health() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok"})
 
 
 @app.websocket("/mcp")
@@ -256,7 +535,7 @@ async def mcp_endpoint(websocket: WebSocket) -> None:
 
 
 @app.get("/lm/models")
-async def list_lm_models() -> JSONResponse:
+async def list_lm_models() -> ORJSONResponse:
     try:
         models = await lm_client.list_models()
     except LMStudioAPIError as error:
@@ -265,18 +544,26 @@ async def list_lm_models() -> JSONResponse:
             detail=str(error),
         ) from error
 
-    return JSONResponse({"models": models, "selected_model": lm_client.selected_model})
+    return ORJSONResponse({"models": models, "selected_model": lm_client.selected_model})
 
 
 @app.get("/lm/selection")
-async def get_lm_selection() -> JSONResponse:
-    return JSONResponse({"selected_model": lm_client.selected_model})
+async def get_lm_selection() -> ORJSONResponse:
+    return ORJSONResponse({"selected_model": lm_client.selected_model})
 
 
-@app.post("/lm/select")
-async def select_lm_model(request: SelectModelRequest) -> JSONResponse:
+@app.post("/lm/select", openapi_extra=json_request_body(SelectModelRequest))
+async def select_lm_model(request: Request) -> ORJSONResponse:
+    try:
+        body = msgspec.json.decode(await request.body(), type=SelectModelRequest)
+    except msgspec.DecodeError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
+        ) from error
+
     try:
-        selected = await lm_client.select_model(request.model)
+        selected = await lm_client.select_model(body.model)
     except ValueError as error:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -288,13 +575,31 @@ async def select_lm_model(request: SelectModelRequest) -> JSONResponse:
             detail=str(error),
         ) from error
 
-    return JSONResponse({"selected_model": selected})
+    return ORJSONResponse({"selected_model": selected})
 
 
-@app.post("/lm/chat")
-async def lm_chat_completion(request: ChatCompletionRequest) -> JSONResponse:
-    payload = request.model_dump(by_alias=True, exclude_none=True)
+@app.post("/lm/chat", openapi_extra=json_request_body(ChatCompletionRequest))
+async def lm_chat_completion(request: Request) -> Response:
+    # The body is forwarded to LM Studio (including fields ChatCompletionRequest does not
+    # declare), so it is only type-checked against the struct rather than decoded into it.
     try:
+        body = msgspec.json.decode(await request.body())
+        msgspec.convert(body, ChatCompletionRequest)
+    except msgspec.DecodeError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
+        ) from error
+    # Explicit nulls mean "use the default", so they are dropped rather than sent upstream.
+    payload = {key: value for key, value in body.items() if value is not None}
+
+    stream = payload.pop("stream", False)
+    try:
+        if stream:
+            return StreamingResponse(
+                await lm_client.stream_chat_completion(payload),
+                media_type="text/event-stream",
+            )
         response = await lm_client.create_chat_completion(payload)
     except ValueError as error:
         raise HTTPException(
@@ -307,4 +612,4 @@ async def lm_chat_completion(request: ChatCompletionRequest) -> JSONResponse:
             detail=str(error),
         ) from error
 
-    return JSONResponse(response)
+    return ORJSONResponse(response)